@@ -1,3 +1,3 @@
-from .braviaclient import BraviaClient
+from .braviaclient import BraviaClient, AsyncBraviaClient
 
-__all__ = ('BraviaClient')
+__all__ = ('BraviaClient', 'AsyncBraviaClient')
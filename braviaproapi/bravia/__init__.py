@@ -1,12 +1,47 @@
-from .appcontrol import AppControl, AppFeature
-from .audio import Audio, AudioOutput, TvPosition, SubwooferPhase, VolumeDevice, SpeakerSetting
-from .avcontent import AvContent, InputIcon
-from .encryption import Encryption
-from .http import Http
-from .remote import Remote, ButtonCode
-from .system import System, LedMode, PowerSavingMode
-from .videoscreen import VideoScreen, SceneMode
+from importlib import import_module
+
+# Submodules are imported on first access (PEP 562) so that using one part of the API does not load the rest.
+_LAZY_ATTRIBUTES = {
+    'AppControl': 'appcontrol',
+    'AppFeature': 'appcontrol',
+    'Audio': 'audio',
+    'AsyncAudio': 'audio',
+    'AudioOutput': 'audio',
+    'TvPosition': 'audio',
+    'SubwooferPhase': 'audio',
+    'VolumeDevice': 'audio',
+    'SpeakerSetting': 'audio',
+    'AvContent': 'avcontent',
+    'InputIcon': 'avcontent',
+    'Encryption': 'encryption',
+    'Http': 'http',
+    'AsyncHttp': 'http_async',
+    'Remote': 'remote',
+    'ButtonCode': 'remote',
+    'System': 'system',
+    'AsyncSystem': 'system',
+    'LedMode': 'system',
+    'PowerSavingMode': 'system',
+    'VideoScreen': 'videoscreen',
+    'SceneMode': 'videoscreen'
+}
 
 __all__ = ('AppControl', 'Audio', 'AvContent', 'Encryption', 'Http', 'Remote', 'System', 'VideoScreen', 'SceneMode',
            'LedMode', 'PowerSavingMode', 'ButtonCode', 'InputIcon', 'AudioOutput', 'TvPosition', 'SubwooferPhase',
-           'VolumeDevice', 'SpeakerSetting', 'AppFeature')
+           'VolumeDevice', 'SpeakerSetting', 'AppFeature', 'AsyncAudio', 'AsyncHttp', 'AsyncSystem')
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+
+    value = getattr(import_module("." + module_name, __name__), name)
+
+    # Cache the attribute so that this function is not called again for it
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,4 +1,3 @@
-import re
 from enum import Enum
 from .errors import HttpError, ApiError, InternalError, ErrorCode, get_error_message, \
     TargetNotSupportedError, VolumeOutOfRangeError
@@ -84,6 +83,64 @@ class SpeakerSetting(Enum):
     SUBWOOFER_POWER = 5
 
 
+_OUTPUT_MODES = {
+    "speaker": AudioOutput.SPEAKER,
+    "speaker_hdmi": AudioOutput.SPEAKER_HDMI,
+    "hdmi": AudioOutput.HDMI,
+    "audioSystem": AudioOutput.AUDIO_SYSTEM
+}
+
+_VALID_POSITIONS = {
+    "tableTop": TvPosition.TABLE_TOP,
+    "wallMount": TvPosition.WALL_MOUNT
+}
+
+_VALID_SUB_PHASES = {
+    "normal": SubwooferPhase.NORMAL,
+    "reverse": SubwooferPhase.REVERSE
+}
+
+_VALID_DEVICES = {
+    "speaker": VolumeDevice.SPEAKERS,
+    "headphone": VolumeDevice.HEADPHONES
+}
+
+# A device of None applies the volume change to all devices
+_REQUESTED_DEVICES = {
+    None: "",
+    VolumeDevice.SPEAKERS: "speaker",
+    VolumeDevice.HEADPHONES: "headphone"
+}
+
+# Indexed by the show_ui flag
+_UI_VISIBILITY = ("off", "on")
+
+_REQUESTED_OUTPUTS = {
+    AudioOutput.SPEAKER: "speaker",
+    AudioOutput.SPEAKER_HDMI: "speaker_hdmi",
+    AudioOutput.HDMI: "hdmi",
+    AudioOutput.AUDIO_SYSTEM: "audioSystem"
+}
+
+_SPEAKER_TARGETS = {
+    SpeakerSetting.TV_POSITION: "tvPosition",
+    SpeakerSetting.SUBWOOFER_LEVEL: "subwooferLevel",
+    SpeakerSetting.SUBWOOFER_FREQUENCY: "subwooferFreq",
+    SpeakerSetting.SUBWOOFER_PHASE: "subwooferPhase",
+    SpeakerSetting.SUBWOOFER_POWER: "subwooferPower"
+}
+
+_REQUESTED_POSITIONS = {
+    TvPosition.TABLE_TOP: "tableTop",
+    TvPosition.WALL_MOUNT: "wallMount"
+}
+
+_REQUESTED_SUB_PHASES = {
+    SubwooferPhase.NORMAL: "normal",
+    SubwooferPhase.REVERSE: "reverse"
+}
+
+
 class Audio(object):
     '''
     Provides functionality for controlling audio on the target device.
@@ -92,6 +149,7 @@ class Audio(object):
         bravia_client: The parent :class:`BraviaClient` instance.
         http_client: The :class:`Http` instance associated with the parent client.
     '''
+    __slots__ = ("bravia_client", "http_client")
 
     def __init__(self, bravia_client, http_client):
         self.bravia_client = bravia_client
@@ -124,27 +182,7 @@ class Audio(object):
             else:
                 raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if type(response) is not list or len(response) > 1:
-            raise ApiError("API returned unexpected response format for getSoundSettings")
-
-        output_terminal = response[0]
-
-        output_modes = {
-            "speaker": AudioOutput.SPEAKER,
-            "speaker_hdmi": AudioOutput.SPEAKER_HDMI,
-            "hdmi": AudioOutput.HDMI,
-            "audioSystem": AudioOutput.AUDIO_SYSTEM
-        }
-        current_output = output_modes.get(output_terminal.get("currentValue"), AudioOutput.UNKNOWN)
-
-        if current_output == AudioOutput.UNKNOWN:
-            raise ApiError(
-                "API returned unexpected audio output '{0}'".format(output_terminal.get("currentValue"))
-            )
-
-        return {
-            "output": current_output
-        }
+        return _parse_output_device(response)
 
     def get_speaker_settings(self):
         '''
@@ -176,60 +214,7 @@ class Audio(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if type(response) is not list:
-            raise ApiError("API returned unexpected response format for getSoundSettings.")
-
-        settings = {
-            SpeakerSetting.TV_POSITION: None,
-            SpeakerSetting.SUBWOOFER_LEVEL: None,
-            SpeakerSetting.SUBWOOFER_FREQUENCY: None,
-            SpeakerSetting.SUBWOOFER_PHASE: None,
-            SpeakerSetting.SUBWOOFER_POWER: None
-        }
-
-        valid_positions = {
-            "tableTop": TvPosition.TABLE_TOP,
-            "wallMount": TvPosition.WALL_MOUNT
-        }
-
-        valid_sub_phases = {
-            "normal": SubwooferPhase.NORMAL,
-            "reverse": SubwooferPhase.REVERSE
-        }
-
-        for setting in response:
-            target = setting.get("target")
-
-            if target == "tvPosition":
-                position = valid_positions.get(setting.get("currentValue"), TvPosition.UNKNOWN)
-                if position == TvPosition.UNKNOWN:
-                    raise ApiError(
-                        "API returned unexpected TV position '{0}'".format(setting.get("currentValue"))
-                    )
-                settings[SpeakerSetting.TV_POSITION] = position
-
-            elif target == "subwooferLevel":
-                settings[SpeakerSetting.SUBWOOFER_LEVEL] = setting.get("currentValue")
-
-            elif target == "subwooferFreq":
-                settings[SpeakerSetting.SUBWOOFER_FREQUENCY] = setting.get("currentValue")
-
-            elif target == "subwooferPhase":
-                phase = valid_sub_phases.get(setting.get("currentValue"), SubwooferPhase.UNKNOWN)
-                if phase == SubwooferPhase.UNKNOWN:
-                    raise ApiError(
-                        "API returned unexpected subwoofer phase '{0}'".format(setting.get("currentValue"))
-                    )
-                settings[SpeakerSetting.SUBWOOFER_PHASE] = phase
-
-            elif target == "subwooferPower":
-                settings[SpeakerSetting.SUBWOOFER_POWER] = True if setting.get("currentValue") == "on" else False
-
-            # Skip settings that are unrecognized
-            else:
-                continue
-
-        return settings
+        return _parse_speaker_settings(response)
 
     def get_volume_information(self):
         '''
@@ -255,32 +240,7 @@ class Audio(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if type(response) is not list:
-            raise ApiError("API returned unexpected response format for getVolumeInformation.")
-
-        valid_devices = {
-            "speaker": VolumeDevice.SPEAKERS,
-            "headphone": VolumeDevice.HEADPHONES
-        }
-
-        devices = []
-        for this_device in response:
-            device_type = valid_devices.get(this_device.get("target"))
-
-            # Ignore unexpected device types
-            if device_type is None:
-                continue
-
-            device_info = {
-                "type": device_type,
-                "volume": this_device.get("volume"),
-                "muted": True if this_device.get("mute") else False,
-                "min_volume": this_device.get("minVolume"),
-                "max_volume": this_device.get("maxVolume")
-            }
-            devices.append(device_info)
-
-        return devices
+        return _parse_volume_information(response)
 
     def mute(self):
         '''
@@ -316,7 +276,7 @@ class Audio(object):
 
         self.bravia_client.initialize()
 
-        if type(mute) is not bool:
+        if not isinstance(mute, bool):
             raise TypeError("mute must be a boolean value")
 
         try:
@@ -376,7 +336,7 @@ class Audio(object):
         if type(increase_by) is not int:
             raise TypeError("increase_by must be an integer value")
 
-        self.__set_volume("+" + str(increase_by), show_ui, device)
+        self.__set_volume(f"+{increase_by}", show_ui, device)
 
     def decrease_volume(self, decrease_by=1, show_ui=True, device=None):
         '''
@@ -400,58 +360,17 @@ class Audio(object):
         if type(decrease_by) is not int:
             raise TypeError("decrease_by must be an integer value")
 
-        self.__set_volume("-" + str(decrease_by), show_ui, device)
+        self.__set_volume(f"-{decrease_by}", show_ui, device)
 
     def __set_volume(self, volume, show_ui=True, device=None):
         self.bravia_client.initialize()
 
-        if device is not None and type(device) is not VolumeDevice:
-            raise TypeError("device must be a VolumeDevice enum type or None")
-
-        if device == VolumeDevice.UNKNOWN:
-            raise ValueError("device cannot be VolumeDevice.UNKNOWN")
-
-        if type(volume) is not int and type(volume) is not str:
-            raise TypeError("volume must be an int or string")
-
-        if type(volume) is str:
-            if re.match(r'^[+-]\d+$', volume) is None:
-                raise ValueError("volume must be in the format 1, +1, or -1")
-
-        if type(show_ui) is not bool:
-            raise TypeError("show_ui must be a boolean value")
-
-        if device is None:
-            target = ""
-        else:
-            valid_requested_devices = {
-                VolumeDevice.SPEAKERS: "speaker",
-                VolumeDevice.HEADPHONES: "headphone"
-            }
-            target = valid_requested_devices.get(device)
-            if target is None:
-                raise InternalError("Internal error: Invalid VolumeDevice specified")
+        params = _get_volume_params(volume, show_ui, device)
 
         try:
-            self.http_client.request(
-                endpoint="audio",
-                method="setAudioVolume",
-                params={
-                    "target": target,
-                    "volume": str(volume),
-                    "ui": "on" if show_ui else "off"
-                },
-                version="1.2"
-            )
+            self.http_client.request(endpoint="audio", method="setAudioVolume", params=params, version="1.2")
         except HttpError as err:
-            if err.error_code == ErrorCode.TARGET_NOT_SUPPORTED.value:
-                raise TargetNotSupportedError(
-                    "The target device does not support controlling volume of the specified output."
-                )
-            if err.error_code == ErrorCode.VOLUME_OUT_OF_RANGE.value:
-                raise VolumeOutOfRangeError("The specified volume value is out of range for the target device.")
-            else:
-                raise ApiError(get_error_message(err.error_code, str(err))) from None
+            raise _get_volume_error(err) from None
 
     def set_output_device(self, output_device):
         '''
@@ -469,22 +388,7 @@ class Audio(object):
 
         self.bravia_client.initialize()
 
-        if type(output_device) is not AudioOutput:
-            raise TypeError("output_device must be an AudioOutput enum type")
-
-        if output_device == AudioOutput.UNKNOWN:
-            raise ValueError("output_device cannot be AudioOutput.UNKNOWN")
-
-        valid_outputs = {
-            AudioOutput.SPEAKER: "speaker",
-            AudioOutput.SPEAKER_HDMI: "speaker_hdmi",
-            AudioOutput.HDMI: "hdmi",
-            AudioOutput.AUDIO_SYSTEM: "audioSystem"
-        }
-
-        request_output = valid_outputs.get(output_device, AudioOutput.UNKNOWN)
-        if request_output == AudioOutput.UNKNOWN:
-            raise InternalError("Internal error: unsupported AudioOutput selected")
+        request_output = _get_selected_output(output_device)
 
         try:
             self.http_client.request(
@@ -525,117 +429,453 @@ class Audio(object):
 
         self.bravia_client.initialize()
 
-        if type(settings) is not dict:
-            raise TypeError("settings must be a dict type")
+        settings_to_request = _get_speaker_settings_request(settings)
 
-        valid_targets = {
-            SpeakerSetting.TV_POSITION: "tvPosition",
-            SpeakerSetting.SUBWOOFER_LEVEL: "subwooferLevel",
-            SpeakerSetting.SUBWOOFER_FREQUENCY: "subwooferFreq",
-            SpeakerSetting.SUBWOOFER_PHASE: "subwooferPhase",
-            SpeakerSetting.SUBWOOFER_POWER: "subwooferPower"
-        }
+        try:
+            self.http_client.request(
+                endpoint="audio",
+                method="setSpeakerSettings",
+                params={"settings": settings_to_request},
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        settings_to_request = []
 
-        if settings.get(SpeakerSetting.TV_POSITION) is not None:
-            position = self.__get_selected_tv_position(settings.get(SpeakerSetting.TV_POSITION))
-            settings_to_request.append({"target": valid_targets[SpeakerSetting.TV_POSITION], "value": position})
+class AsyncAudio(object):
+    '''
+    Provides asynchronous functionality for controlling audio on the target device. Each method behaves the same as
+    its counterpart in :class:`Audio`.
 
-        if settings.get(SpeakerSetting.SUBWOOFER_LEVEL) is not None:
-            level = self.__get_selected_sub_level(settings.get(SpeakerSetting.SUBWOOFER_LEVEL))
-            settings_to_request.append({"target": valid_targets[SpeakerSetting.SUBWOOFER_LEVEL], "value": level})
+    Args:
+        bravia_client: The parent :class:`AsyncBraviaClient` instance.
+        http_client: The :class:`AsyncHttp` instance associated with the parent client.
+    '''
+    __slots__ = ("bravia_client", "http_client")
 
-        if settings.get(SpeakerSetting.SUBWOOFER_FREQUENCY) is not None:
-            frequency = self.__get_selected_sub_freq(settings.get(SpeakerSetting.SUBWOOFER_FREQUENCY))
-            settings_to_request.append({
-                "target": valid_targets[SpeakerSetting.SUBWOOFER_FREQUENCY],
-                "value": frequency
-            })
+    def __init__(self, bravia_client, http_client):
+        self.bravia_client = bravia_client
+        self.http_client = http_client
+
+    async def get_output_device(self):
+        '''
+        Returns the current audio output device on the target device. See :meth:`Audio.get_output_device`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(
+                endpoint="audio",
+                method="getSoundSettings",
+                params={"target": "outputTerminal"},
+                version="1.1"
+            )
+        except HttpError as err:
+            if err.error_code == ErrorCode.ILLEGAL_ARGUMENT.value:
+                # The requested target does not exist, but that's not necessarily a fatal error
+                return None
+            else:
+                raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if settings.get(SpeakerSetting.SUBWOOFER_PHASE) is not None:
-            phase = self.__get_selected_sub_phase(settings.get(SpeakerSetting.SUBWOOFER_PHASE))
-            settings_to_request.append({"target": valid_targets[SpeakerSetting.SUBWOOFER_PHASE], "value": phase})
+        return _parse_output_device(response)
 
-        if settings.get(SpeakerSetting.SUBWOOFER_POWER) is not None:
-            power = self.__get_selected_sub_power(settings.get(SpeakerSetting.SUBWOOFER_POWER))
-            settings_to_request.append({
-                "target": valid_targets[SpeakerSetting.SUBWOOFER_POWER],
-                "value": power
-            })
+    async def get_speaker_settings(self):
+        '''
+        Returns the current audio settings for the target device. See :meth:`Audio.get_speaker_settings`.
+        '''
 
-        if len(settings_to_request) == 0:
-            raise ValueError("No valid settings were specified")
+        await self.bravia_client.initialize()
 
         try:
-            self.http_client.request(
+            response = await self.http_client.request(
                 endpoint="audio",
-                method="setSpeakerSettings",
-                params={"settings": settings_to_request},
+                method="getSpeakerSettings",
+                params={"target": ""},
                 version="1.0"
             )
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-    def __get_selected_tv_position(self, value):
-        if type(value) is not TvPosition:
-            raise TypeError(
-                "Setting value for SpeakerSetting.TV_POSITION must be specified as a TvPosition enum type"
+        return _parse_speaker_settings(response)
+
+    async def get_volume_information(self):
+        '''
+        Returns the current volume information of each audio output device on the target device. See\
+        :meth:`Audio.get_volume_information`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(endpoint="audio", method="getVolumeInformation", version="1.0")
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_volume_information(response)
+
+    async def mute(self):
+        '''
+        Mutes the current audio output device on the target device. See :meth:`Audio.mute`.
+        '''
+
+        await self.set_mute(True)
+
+    async def unmute(self):
+        '''
+        Unmutes the current audio output device on the target device. See :meth:`Audio.unmute`.
+        '''
+
+        await self.set_mute(False)
+
+    async def set_mute(self, mute):
+        '''
+        Mutes or unmutes the current audio output device on the target device. See :meth:`Audio.set_mute`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        if not isinstance(mute, bool):
+            raise TypeError("mute must be a boolean value")
+
+        try:
+            await self.http_client.request(
+                endpoint="audio",
+                method="setAudioMute",
+                params={"status": mute},
+                version="1.0"
             )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if value == TvPosition.UNKNOWN:
-            raise ValueError("Setting value for SpeakerSetting.TV_POSITION cannot be TvPosition.UNKNOWN")
+    async def set_volume_level(self, volume, show_ui=True, device=None):
+        '''
+        Sets the volume level of the specified audio output device on the target device. See\
+        :meth:`Audio.set_volume_level`.
+        '''
+        if type(volume) is not int:
+            raise TypeError("volume must be an integer value")
 
-        valid_positions = {
-            TvPosition.TABLE_TOP: "tableTop",
-            TvPosition.WALL_MOUNT: "wallMount"
-        }
+        await self.__set_volume(volume, show_ui, device)
 
-        position = valid_positions.get(value, TvPosition.UNKNOWN)
+    async def increase_volume(self, increase_by=1, show_ui=True, device=None):
+        '''
+        Increases volume level of the specified audio output device on the target device. See\
+        :meth:`Audio.increase_volume`.
+        '''
+        if type(increase_by) is not int:
+            raise TypeError("increase_by must be an integer value")
 
-        if position == TvPosition.UNKNOWN:
-            raise InternalError("Internal error: unsupported TvPosition selected")
+        await self.__set_volume(f"+{increase_by}", show_ui, device)
 
-        return position
+    async def decrease_volume(self, decrease_by=1, show_ui=True, device=None):
+        '''
+        Decreases volume level of the specified audio output device on the target device. See\
+        :meth:`Audio.decrease_volume`.
+        '''
+        if type(decrease_by) is not int:
+            raise TypeError("decrease_by must be an integer value")
 
-    def __get_selected_sub_level(self, value):
-        if type(value) is not int:
-            raise TypeError("Setting value for SpeakerSetting.SUBWOOFER_LEVEL must be an integer type")
+        await self.__set_volume(f"-{decrease_by}", show_ui, device)
 
-        return str(value)
+    async def __set_volume(self, volume, show_ui=True, device=None):
+        await self.bravia_client.initialize()
 
-    def __get_selected_sub_freq(self, value):
-        if type(value) is not int:
-            raise TypeError("Setting value for SpeakerSetting.SUBWOOFER_FREQUENCY must be an integer type")
+        params = _get_volume_params(volume, show_ui, device)
 
-        return str(value)
+        try:
+            await self.http_client.request(endpoint="audio", method="setAudioVolume", params=params, version="1.2")
+        except HttpError as err:
+            raise _get_volume_error(err) from None
+
+    async def set_output_device(self, output_device):
+        '''
+        Sets which audio output device the target device should use. See :meth:`Audio.set_output_device`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        request_output = _get_selected_output(output_device)
 
-    def __get_selected_sub_phase(self, value):
-        if type(value) is not SubwooferPhase:
-            raise TypeError(
-                ("Setting value for SpeakerSetting.SUBWOOFER_PHASE must be specified as "
-                    "a SubwooferPhase enum type")
+        try:
+            await self.http_client.request(
+                endpoint="audio",
+                method="setSoundSettings",
+                params={"settings": [{"target": "outputTerminal", "value": request_output}]},
+                version="1.1"
             )
+        except HttpError as err:
+            if err.error_code == ErrorCode.MULTIPLE_SETTINGS_FAILED.value:
+                raise ApiError("Unable to set sound output device")
+            else:
+                raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+    async def set_speaker_settings(self, settings):
+        '''
+        Configures the settings relating to speakers on the target device. See :meth:`Audio.set_speaker_settings`.
+        '''
+
+        await self.bravia_client.initialize()
 
-        if value == SubwooferPhase.UNKNOWN:
-            raise ValueError(
-                "Setting value for SpeakerSetting.SUBWOOFER_PHASE cannot be SubwooferPhase.UNKNOWN"
+        settings_to_request = _get_speaker_settings_request(settings)
+
+        try:
+            await self.http_client.request(
+                endpoint="audio",
+                method="setSpeakerSettings",
+                params={"settings": settings_to_request},
+                version="1.0"
             )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+
+def _parse_output_device(response):
+    if not isinstance(response, list) or len(response) > 1:
+        raise ApiError("API returned unexpected response format for getSoundSettings")
+
+    output_terminal = response[0]
+
+    current_output = _OUTPUT_MODES.get(output_terminal.get("currentValue"), AudioOutput.UNKNOWN)
+
+    if current_output == AudioOutput.UNKNOWN:
+        raise ApiError(
+            f"API returned unexpected audio output '{output_terminal.get('currentValue')}'"
+        )
+
+    return {
+        "output": current_output
+    }
+
+
+def _parse_speaker_settings(response):
+    if not isinstance(response, list):
+        raise ApiError("API returned unexpected response format for getSoundSettings.")
+
+    settings = {
+        SpeakerSetting.TV_POSITION: None,
+        SpeakerSetting.SUBWOOFER_LEVEL: None,
+        SpeakerSetting.SUBWOOFER_FREQUENCY: None,
+        SpeakerSetting.SUBWOOFER_PHASE: None,
+        SpeakerSetting.SUBWOOFER_POWER: None
+    }
+
+    get_handler = _SPEAKER_HANDLERS.get
+    for setting in response:
+        # Skip settings that are unrecognized
+        handler = get_handler(setting.get("target"))
+        if handler is not None:
+            handler(settings, setting.get("currentValue"))
+
+    return settings
+
+
+def _handle_tv_position(settings, value):
+    position = _VALID_POSITIONS.get(value, TvPosition.UNKNOWN)
+    if position == TvPosition.UNKNOWN:
+        raise ApiError(f"API returned unexpected TV position '{value}'")
+    settings[SpeakerSetting.TV_POSITION] = position
 
-        valid_phases = {
-            SubwooferPhase.NORMAL: "normal",
-            SubwooferPhase.REVERSE: "reverse"
+
+def _handle_sub_level(settings, value):
+    settings[SpeakerSetting.SUBWOOFER_LEVEL] = value
+
+
+def _handle_sub_freq(settings, value):
+    settings[SpeakerSetting.SUBWOOFER_FREQUENCY] = value
+
+
+def _handle_sub_phase(settings, value):
+    phase = _VALID_SUB_PHASES.get(value, SubwooferPhase.UNKNOWN)
+    if phase == SubwooferPhase.UNKNOWN:
+        raise ApiError(f"API returned unexpected subwoofer phase '{value}'")
+    settings[SpeakerSetting.SUBWOOFER_PHASE] = phase
+
+
+def _handle_sub_power(settings, value):
+    settings[SpeakerSetting.SUBWOOFER_POWER] = value == "on"
+
+
+# Handlers for each speaker setting returned by getSpeakerSettings, keyed by target
+_SPEAKER_HANDLERS = {
+    "tvPosition": _handle_tv_position,
+    "subwooferLevel": _handle_sub_level,
+    "subwooferFreq": _handle_sub_freq,
+    "subwooferPhase": _handle_sub_phase,
+    "subwooferPower": _handle_sub_power
+}
+
+
+def _parse_volume_information(response):
+    if not isinstance(response, list):
+        raise ApiError("API returned unexpected response format for getVolumeInformation.")
+
+    devices = []
+    get_device_type = _VALID_DEVICES.get
+    for this_device in response:
+        device_type = get_device_type(this_device.get("target"))
+
+        # Ignore unexpected device types
+        if device_type is None:
+            continue
+
+        device_info = {
+            "type": device_type,
+            "volume": this_device.get("volume"),
+            "muted": bool(this_device.get("mute")),
+            "min_volume": this_device.get("minVolume"),
+            "max_volume": this_device.get("maxVolume")
         }
+        devices.append(device_info)
+
+    return devices
+
+
+def _get_volume_params(volume, show_ui, device):
+    if device is not None and not isinstance(device, VolumeDevice):
+        raise TypeError("device must be a VolumeDevice enum type or None")
+
+    if device == VolumeDevice.UNKNOWN:
+        raise ValueError("device cannot be VolumeDevice.UNKNOWN")
+
+    if type(volume) is not int and not isinstance(volume, str):
+        raise TypeError("volume must be an int or string")
+
+    # Relative volume strings must be a sign followed by digits, e.g. "+1"
+    if isinstance(volume, str) and (volume[:1] not in ("+", "-") or not volume[1:].isdecimal()):
+        raise ValueError("volume must be in the format 1, +1, or -1")
+
+    if not isinstance(show_ui, bool):
+        raise TypeError("show_ui must be a boolean value")
+
+    try:
+        target = _REQUESTED_DEVICES[device]
+    except KeyError:
+        raise InternalError("Internal error: Invalid VolumeDevice specified") from None
+
+    return {
+        "target": target,
+        "volume": str(volume),
+        "ui": _UI_VISIBILITY[show_ui]
+    }
+
+
+def _get_volume_error(err):
+    if err.error_code == ErrorCode.TARGET_NOT_SUPPORTED.value:
+        return TargetNotSupportedError(
+            "The target device does not support controlling volume of the specified output."
+        )
+    if err.error_code == ErrorCode.VOLUME_OUT_OF_RANGE.value:
+        return VolumeOutOfRangeError("The specified volume value is out of range for the target device.")
+    else:
+        return ApiError(get_error_message(err.error_code, str(err)))
+
+
+def _get_selected_output(output_device):
+    if not isinstance(output_device, AudioOutput):
+        raise TypeError("output_device must be an AudioOutput enum type")
+
+    if output_device == AudioOutput.UNKNOWN:
+        raise ValueError("output_device cannot be AudioOutput.UNKNOWN")
+
+    request_output = _REQUESTED_OUTPUTS.get(output_device, AudioOutput.UNKNOWN)
+    if request_output == AudioOutput.UNKNOWN:
+        raise InternalError("Internal error: unsupported AudioOutput selected")
+
+    return request_output
+
+
+def _get_speaker_settings_request(settings):
+    if not isinstance(settings, dict):
+        raise TypeError("settings must be a dict type")
+
+    settings_to_request = []
+
+    if settings.get(SpeakerSetting.TV_POSITION) is not None:
+        position = _get_selected_tv_position(settings.get(SpeakerSetting.TV_POSITION))
+        settings_to_request.append({"target": _SPEAKER_TARGETS[SpeakerSetting.TV_POSITION], "value": position})
+
+    if settings.get(SpeakerSetting.SUBWOOFER_LEVEL) is not None:
+        level = _get_selected_sub_level(settings.get(SpeakerSetting.SUBWOOFER_LEVEL))
+        settings_to_request.append({"target": _SPEAKER_TARGETS[SpeakerSetting.SUBWOOFER_LEVEL], "value": level})
+
+    if settings.get(SpeakerSetting.SUBWOOFER_FREQUENCY) is not None:
+        frequency = _get_selected_sub_freq(settings.get(SpeakerSetting.SUBWOOFER_FREQUENCY))
+        settings_to_request.append({
+            "target": _SPEAKER_TARGETS[SpeakerSetting.SUBWOOFER_FREQUENCY],
+            "value": frequency
+        })
+
+    if settings.get(SpeakerSetting.SUBWOOFER_PHASE) is not None:
+        phase = _get_selected_sub_phase(settings.get(SpeakerSetting.SUBWOOFER_PHASE))
+        settings_to_request.append({"target": _SPEAKER_TARGETS[SpeakerSetting.SUBWOOFER_PHASE], "value": phase})
+
+    if settings.get(SpeakerSetting.SUBWOOFER_POWER) is not None:
+        power = _get_selected_sub_power(settings.get(SpeakerSetting.SUBWOOFER_POWER))
+        settings_to_request.append({
+            "target": _SPEAKER_TARGETS[SpeakerSetting.SUBWOOFER_POWER],
+            "value": power
+        })
+
+    if len(settings_to_request) == 0:
+        raise ValueError("No valid settings were specified")
+
+    return settings_to_request
+
+
+def _get_selected_tv_position(value):
+    if not isinstance(value, TvPosition):
+        raise TypeError(
+            "Setting value for SpeakerSetting.TV_POSITION must be specified as a TvPosition enum type"
+        )
+
+    if value == TvPosition.UNKNOWN:
+        raise ValueError("Setting value for SpeakerSetting.TV_POSITION cannot be TvPosition.UNKNOWN")
+
+    position = _REQUESTED_POSITIONS.get(value, TvPosition.UNKNOWN)
+
+    if position == TvPosition.UNKNOWN:
+        raise InternalError("Internal error: unsupported TvPosition selected")
+
+    return position
+
+
+def _get_selected_sub_level(value):
+    if type(value) is not int:
+        raise TypeError("Setting value for SpeakerSetting.SUBWOOFER_LEVEL must be an integer type")
+
+    return str(value)
+
+
+def _get_selected_sub_freq(value):
+    if type(value) is not int:
+        raise TypeError("Setting value for SpeakerSetting.SUBWOOFER_FREQUENCY must be an integer type")
+
+    return str(value)
+
+
+def _get_selected_sub_phase(value):
+    if not isinstance(value, SubwooferPhase):
+        raise TypeError(
+            ("Setting value for SpeakerSetting.SUBWOOFER_PHASE must be specified as "
+                "a SubwooferPhase enum type")
+        )
+
+    if value == SubwooferPhase.UNKNOWN:
+        raise ValueError(
+            "Setting value for SpeakerSetting.SUBWOOFER_PHASE cannot be SubwooferPhase.UNKNOWN"
+        )
+
+    phase = _REQUESTED_SUB_PHASES.get(value, SubwooferPhase.UNKNOWN)
 
-        phase = valid_phases.get(value, SubwooferPhase.UNKNOWN)
+    if phase == SubwooferPhase.UNKNOWN:
+        raise InternalError("Internal error: unsupported SubwooferPhase selected")
 
-        if phase == SubwooferPhase.UNKNOWN:
-            raise InternalError("Internal error: unsupported SubwooferPhase selected")
+    return phase
 
-        return phase
 
-    def __get_selected_sub_power(self, value):
-        if type(value) is not bool:
-            raise TypeError("Setting value for SpeakerSetting.SUBWOOFER_POWER must be a boolean type")
+def _get_selected_sub_power(value):
+    if not isinstance(value, bool):
+        raise TypeError("Setting value for SpeakerSetting.SUBWOOFER_POWER must be a boolean type")
 
-        return "on" if value else "off"
+    return "on" if value else "off"
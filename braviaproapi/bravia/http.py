@@ -1,12 +1,22 @@
-import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .errors import HttpError
 
+# orjson is considerably faster than the standard library, but is optional.
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
 
 class Http(object):
     '''
     Handles HTTP messaging to the API server.
 
+    A single :class:`requests.Session` is kept for the lifetime of this object so that connections to the target
+    device are reused between calls. Call :meth:`close` to release them.
+
     Args:
         host (str): The HTTP hostname at which the server is running.
         psk (str): The pre-shared key configured on the server.
@@ -17,6 +27,22 @@ class Http(object):
         self.host = host
         self.psk = psk
 
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        '''
+        Closes any open connections to the API server.
+        '''
+
+        self._session.close()
+
     def request(self, endpoint, method, params=None, version="1.0"):
         '''
         Sends a JSON-RPC request to the API server.
@@ -37,28 +63,46 @@ class Http(object):
         '''
 
         self.request_id += 1
+        payload = _build_payload(method, params, version, self.request_id)
+        response = self.__post_json(endpoint, payload)
 
-        url = "http://{0}/sony/{1}".format(self.host, endpoint)
-        headers = {
-            "X-Auth-PSK": self.psk,
-            "Pragma": "no-cache",
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json; charset=UTF-8"
-        }
+        return _extract_result(response)
 
-        request_params = []
-        if params is not None:
-            request_params.append(params)
+    def request_batch(self, calls):
+        '''
+        Sends several JSON-RPC requests to the API server as batches, one per endpoint.
 
-        payload = {
-            "method": method,
-            "params": request_params,
-            "version": version,
-            "id": self.request_id
-        }
+        Args:
+            calls (list(tuple)): The requests to send, each specified as an `(endpoint, method, params, version)`\
+                tuple with the same meaning as the arguments to :meth:`request`.
+
+        Raises:
+            HttpError: The HTTP call failed. Refer to the `error_code` attribute for details.
+
+        Returns:
+            list: The result of each request, in the order the requests were specified. Each result is formatted as\
+            it would be by :meth:`request`. If an individual request failed, its result is the :class:`HttpError`\
+            describing the failure rather than raising it.
+        '''
+
+        results = [None] * len(calls)
+        batches = _group_batch(calls, self.__next_request_id)
+
+        for endpoint, entries in batches.items():
+            response = self.__post_json(endpoint, [payload for _, payload in entries])
+            _demux_batch(entries, response, results)
+
+        return results
+
+    def __next_request_id(self):
+        self.request_id += 1
+        return self.request_id
+
+    def __post_json(self, endpoint, payload):
+        url = "http://{0}/sony/{1}".format(self.host, endpoint)
 
         try:
-            result = requests.post(url, headers=headers, data=json.dumps(payload), timeout=5)
+            result = self._session.post(url, headers=_json_headers(self.psk), data=json_dumps(payload), timeout=5)
         except requests.exceptions.Timeout:
             raise HttpError("The request timed out. Is the device powered with the IP control interface enabled?")
         except requests.exceptions.ConnectionError as err:
@@ -69,29 +113,7 @@ class Http(object):
         if result.status_code != 200:
             raise HttpError("Unexpected status code {0} received".format(str(result.status_code)))
 
-        try:
-            response = result.json()
-        except ValueError:
-            raise HttpError("Unable to deserialize API response. The response was: {0}".format(response.text()))
-
-        if "error" in response:
-            raise HttpError(
-                "{0} (error {1})".format(response["error"][1], response["error"][0]),
-                error_code=response["error"][0]
-            )
-
-        if "result" not in response:
-            raise HttpError("The API response was malformed")
-
-        # The API's response is encapsulated in an array, so extract and return it
-        if not isinstance(response["result"], list):
-            raise ValueError("The API response was in an unexpected format and cannot be processed.")
-        if len(response["result"]) == 0:
-            return None
-        elif len(response["result"]) > 1:
-            return response["result"]
-        else:
-            return response["result"][0]
+        return _decode_response(result)
 
     def remote_request(self, remote_code):
         '''
@@ -127,7 +149,7 @@ class Http(object):
         ).format(remote_code)
 
         try:
-            result = requests.post(url, headers=headers, data=request, timeout=5)
+            result = self._session.post(url, headers=headers, data=request, timeout=5)
         except requests.exceptions.Timeout:
             raise HttpError("The request timed out. Is the device powered with the IRCC interface enabled?")
         except requests.exceptions.ConnectionError as err:
@@ -137,3 +159,85 @@ class Http(object):
 
         if result.status_code != 200:
             raise HttpError("Unexpected status code {0} received".format(str(result.status_code)))
+
+
+def _json_headers(psk):
+    return {
+        "X-Auth-PSK": psk,
+        "Pragma": "no-cache",
+        "Cache-Control": "no-cache",
+        "Content-Type": "application/json; charset=UTF-8"
+    }
+
+
+def _build_payload(method, params, version, request_id):
+    request_params = []
+    if params is not None:
+        request_params.append(params)
+
+    return {
+        "method": method,
+        "params": request_params,
+        "version": version,
+        "id": request_id
+    }
+
+
+def _decode_response(result):
+    # Parse the raw body; the text decode is only needed to report a body that could not be parsed
+    try:
+        return json_loads(result.content)
+    except ValueError:
+        raise HttpError("Unable to deserialize API response. The response was: {0}".format(result.text))
+
+
+def _extract_result(response):
+    if "error" in response:
+        raise HttpError(
+            "{0} (error {1})".format(response["error"][1], response["error"][0]),
+            error_code=response["error"][0]
+        )
+
+    if "result" not in response:
+        raise HttpError("The API response was malformed")
+
+    # The API's response is encapsulated in an array, so extract and return it
+    if not isinstance(response["result"], list):
+        raise ValueError("The API response was in an unexpected format and cannot be processed.")
+    if len(response["result"]) == 0:
+        return None
+    elif len(response["result"]) > 1:
+        return response["result"]
+    else:
+        return response["result"][0]
+
+
+def _group_batch(calls, next_request_id):
+    # Group the requests by endpoint, since each endpoint has its own URL
+    batches = {}
+    for index, (endpoint, method, params, version) in enumerate(calls):
+        payload = _build_payload(method, params, version, next_request_id())
+        batches.setdefault(endpoint, []).append((index, payload))
+
+    return batches
+
+
+def _demux_batch(entries, response, results):
+    # A batch that is rejected outright yields a single error object rather than a list
+    if not isinstance(response, list):
+        _extract_result(response)
+        raise HttpError("The API response was malformed")
+
+    responses_by_id = {item.get("id"): item for item in response if isinstance(item, dict)}
+    for index, payload in entries:
+        item = responses_by_id.get(payload["id"])
+        if item is None:
+            results[index] = HttpError("The API response did not include a result for '{0}'".format(
+                payload["method"]
+            ))
+            continue
+
+        try:
+            results[index] = _extract_result(item)
+        except HttpError as err:
+            results[index] = err
@@ -0,0 +1,112 @@
+from .errors import HttpError
+from .http import json_dumps, _json_headers, _build_payload, _decode_response, _extract_result, _group_batch, \
+    _demux_batch
+
+# httpx is only needed for asynchronous use, so it is optional.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncHttp(object):
+    '''
+    Handles asynchronous HTTP messaging to the API server. Requires the `httpx` package.
+
+    A single :class:`httpx.AsyncClient` is kept for the lifetime of this object so that connections to the target
+    device are reused between calls. Call :meth:`close` to release them.
+
+    Args:
+        host (str): The HTTP hostname at which the server is running.
+        psk (str): The pre-shared key configured on the server.
+
+    Raises:
+        ImportError: The `httpx` package is not installed.
+    '''
+    request_id = 0
+
+    def __init__(self, host, psk):
+        if httpx is None:
+            raise ImportError("The httpx package is required for asynchronous support")
+
+        self.host = host
+        self.psk = psk
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            timeout=5
+        )
+
+    async def close(self):
+        '''
+        Closes any open connections to the API server.
+        '''
+
+        await self._client.aclose()
+
+    async def request(self, endpoint, method, params=None, version="1.0"):
+        '''
+        Sends a JSON-RPC request to the API server.
+
+        Args:
+            endpoint (str): The API endpoint to send to.
+            method (str): The RPC method to execute.
+            params (dict, optional): Defaults to `None`. Parameters to send on the request.
+            version (str, optional): Defaults to "1.0". The version of the API endpoint to request.
+
+        Raises:
+            HttpError: The HTTP call failed. Refer to the `error_code` attribute for details.
+
+        Returns:
+            list or None: See :meth:`Http.request`.
+        '''
+
+        self.request_id += 1
+        payload = _build_payload(method, params, version, self.request_id)
+        response = await self.__post_json(endpoint, payload)
+
+        return _extract_result(response)
+
+    async def request_batch(self, calls):
+        '''
+        Sends several JSON-RPC requests to the API server as batches, one per endpoint.
+
+        Args:
+            calls (list(tuple)): The requests to send, each specified as an `(endpoint, method, params, version)`\
+                tuple with the same meaning as the arguments to :meth:`request`.
+
+        Raises:
+            HttpError: The HTTP call failed. Refer to the `error_code` attribute for details.
+
+        Returns:
+            list: See :meth:`Http.request_batch`.
+        '''
+
+        results = [None] * len(calls)
+        batches = _group_batch(calls, self.__next_request_id)
+
+        for endpoint, entries in batches.items():
+            response = await self.__post_json(endpoint, [payload for _, payload in entries])
+            _demux_batch(entries, response, results)
+
+        return results
+
+    def __next_request_id(self):
+        self.request_id += 1
+        return self.request_id
+
+    async def __post_json(self, endpoint, payload):
+        url = "http://{0}/sony/{1}".format(self.host, endpoint)
+
+        try:
+            result = await self._client.post(url, headers=_json_headers(self.psk), content=json_dumps(payload))
+        except httpx.TimeoutException:
+            raise HttpError("The request timed out. Is the device powered with the IP control interface enabled?")
+        except httpx.TransportError as err:
+            raise HttpError("A connection error occurred: {0}".format(str(err)))
+        except httpx.HTTPError as err:
+            raise HttpError("An unexpected error occurred while sending the request: {0}".format(str(err)))
+
+        if result.status_code != 200:
+            raise HttpError("Unexpected status code {0} received".format(str(result.status_code)))
+
+        return _decode_response(result)
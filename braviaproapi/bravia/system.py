@@ -1,7 +1,9 @@
+import re
+from datetime import datetime
 from enum import Enum
-from dateutil import parser as date_parser
+from operator import itemgetter
 from .errors import HttpError, ApiError, LanguageNotSupportedError, InternalError, ErrorCode, get_error_message
-from .util import coalesce_none_or_empty
+from .util import cached, invalidate_cache
 
 
 # Possible LED modes returned by API
@@ -44,6 +46,88 @@ class PowerSavingMode(Enum):
     PICTURE_OFF = 4
 
 
+_LED_STATUSES = {
+    "true": True,
+    "false": False
+}
+
+_LED_MODES_IN = {
+    "Demo": LedMode.DEMO,
+    "AutoBrightnessAdjust": LedMode.AUTO_BRIGHTNESS,
+    "Dark": LedMode.DARK,
+    "SimpleResponse": LedMode.SIMPLE_RESPONSE,
+    "Off": LedMode.OFF
+}
+
+_SAVING_MODES_IN = {
+    "off": PowerSavingMode.OFF,
+    "low": PowerSavingMode.LOW,
+    "high": PowerSavingMode.HIGH,
+    "pictureOff": PowerSavingMode.PICTURE_OFF
+}
+
+_LED_MODES_OUT = {
+    LedMode.AUTO_BRIGHTNESS: "AutoBrightnessAdjust",
+    LedMode.DARK: "Dark",
+    LedMode.SIMPLE_RESPONSE: "SimpleResponse",
+    LedMode.DEMO: "Demo",
+    LedMode.OFF: "Off"
+}
+
+_SAVING_MODES_OUT = {
+    PowerSavingMode.OFF: "off",
+    PowerSavingMode.LOW: "low",
+    PowerSavingMode.HIGH: "high",
+    PowerSavingMode.PICTURE_OFF: "pictureOff"
+}
+
+
+# Mappings of returned dict keys to the API response fields they are read from. Empty field values are returned
+# as None.
+_INTERFACE_FIELDS = (
+    ("product_category", "productCategory"),
+    ("product_name", "productName"),
+    ("model_name", "modelName"),
+    ("server_name", "serverName"),
+    ("interface_version", "interfaceVersion")
+)
+
+_NETWORK_INTERFACE_FIELDS = (
+    ("name", "netif"),
+    ("mac", "hwAddr"),
+    ("ip_v4", "ipAddrV4"),
+    ("ip_v6", "ipAddrV6"),
+    ("netmask", "netmask"),
+    ("gateway", "gateway")
+)
+
+_SYSTEM_INFO_FIELDS = (
+    ("product", "product"),
+    ("language", "language"),
+    ("model", "model"),
+    ("serial", "serial"),
+    ("mac", "macAddr"),
+    ("name", "name"),
+    ("generation", "generation")
+)
+
+_get_name_and_value = itemgetter("name", "value")
+
+_UTC_OFFSET_RE = re.compile(r'Z$|([+-]\d{2}):?(\d{2})$')
+
+# Calls made by get_status_bundle(), in the order their results are parsed
+_STATUS_BUNDLE_CALLS = [
+    ("system", "getInterfaceInformation", None, "1.0"),
+    ("system", "getPowerStatus", None, "1.0"),
+    ("system", "getLEDIndicatorStatus", None, "1.0"),
+    ("system", "getNetworkSettings", {"netif": ""}, "1.0"),
+    ("system", "getPowerSavingMode", None, "1.0"),
+    ("system", "getSystemInformation", None, "1.0"),
+    ("system", "getSystemSupportedFunction", None, "1.0"),
+    ("system", "getWolMode", None, "1.0")
+]
+
+
 class System(object):
     '''
     Provides functionality for configuring the target device.
@@ -52,6 +136,7 @@ class System(object):
         bravia_client: The parent :class:`BraviaClient` instance.
         http_client: The :class:`Http` instance associated with the parent client.
     '''
+    __slots__ = ("bravia_client", "http_client", "_cache")
 
     def __init__(self, bravia_client, http_client):
         self.bravia_client = bravia_client
@@ -64,7 +149,6 @@ class System(object):
         Raises:
             ApiError: The request to the target device failed.
         '''
-        self.bravia_client.initialize()
 
         self.set_power_status(True)
 
@@ -75,7 +159,6 @@ class System(object):
         Raises:
             ApiError: The request to the target device failed.
         '''
-        self.bravia_client.initialize()
 
         self.set_power_status(False)
 
@@ -92,7 +175,7 @@ class System(object):
         '''
         self.bravia_client.initialize()
 
-        if type(power_state) is not bool:
+        if not isinstance(power_state, bool):
             raise TypeError("power_state must be a boolean type")
 
         try:
@@ -123,13 +206,7 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if response["status"] == "standby":
-            return False
-
-        if response["status"] == "active":
-            return True
-
-        raise ApiError("Unexpected getPowerStatus response '{0}'".format(response["status"]))
+        return _parse_power_status(response)
 
     def get_current_time(self):
         '''
@@ -146,8 +223,7 @@ class System(object):
 
         try:
             response = self.http_client.request(endpoint="system", method="getCurrentTime", version="1.1")
-            date = date_parser.parse(response["dateTime"])
-            return date
+            return _parse_current_time(response)
 
         except HttpError as err:
             # Illegal state indicates that the system clock is not set, so there is no time to return.
@@ -156,11 +232,15 @@ class System(object):
             else:
                 raise ApiError(get_error_message(err.error_code, str(err))) from None
 
+    @cached(ttl=3600)
     def get_interface_information(self):
         '''
         Returns information about the server on the target device. This is used internally to check the current API
         version.
 
+        Args:
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
+
         Raises:
             ApiError: The request to the target device failed.
 
@@ -181,20 +261,16 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        interface_info = {
-            "product_category": coalesce_none_or_empty(response.get("productCategory")),
-            "product_name": coalesce_none_or_empty(response.get("productName")),
-            "model_name": coalesce_none_or_empty(response.get("modelName")),
-            "server_name": coalesce_none_or_empty(response.get("serverName")),
-            "interface_version": coalesce_none_or_empty(response.get("interfaceVersion"))
-        }
-
-        return interface_info
+        return _parse_interface_information(response)
 
+    @cached(ttl=30)
     def get_led_status(self):
         '''
         Returns the current mode of the device's LED and whether it is enabled.
 
+        Args:
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
+
         Raises:
             ApiError: The request to the target device failed.
 
@@ -215,39 +291,16 @@ class System(object):
             else:
                 raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        # API may return None for LED status if it is unknown
-        led_status = None
-        if "status" in response:
-            if response["status"] == "true":
-                led_status = True
-            elif response["status"] == "false":
-                led_status = False
-
-        led_mode = None
-        if "mode" in response:
-            valid_modes = {
-                "Demo": LedMode.DEMO,
-                "AutoBrightnessAdjust": LedMode.AUTO_BRIGHTNESS,
-                "Dark": LedMode.DARK,
-                "SimpleResponse": LedMode.SIMPLE_RESPONSE,
-                "Off": LedMode.OFF
-            }
-            led_mode = valid_modes.get(response.get("mode"), LedMode.UNKNOWN)
-
-            if led_mode == LedMode.UNKNOWN:
-                raise ApiError("API returned unexpected LED mode '{0}'".format(response.get("mode")))
-
-        return {
-            "status": led_status,
-            "mode": led_mode
-        }
+        return _parse_led_status(response)
 
+    @cached(ttl=30)
     def get_network_settings(self, interface=None):
         '''
         Returns informaton about the target device's network configuration.
 
         Args:
             interface (str, optional): Defaults to `None` (all interfaces). The interface to get information about.
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
 
         Raises:
             ApiError: The request to the target device failed.
@@ -269,7 +322,7 @@ class System(object):
 
         request_interface = interface or ""
 
-        if type(request_interface) is not str:
+        if not isinstance(request_interface, str):
             raise TypeError("interface argument must be a string")
 
         try:
@@ -286,23 +339,7 @@ class System(object):
             else:
                 raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if type(response) is not list:
-            raise ApiError("API returned unexpected response format for getNetworkSettings")
-
-        network_interfaces = []
-        for iface in response:
-            dns = iface.get("dns")
-
-            iface_info = {
-                "name": coalesce_none_or_empty(iface.get("netif")),
-                "mac": coalesce_none_or_empty(iface.get("hwAddr")),
-                "ip_v4": coalesce_none_or_empty(iface.get("ipAddrV4")),
-                "ip_v6": coalesce_none_or_empty(iface.get("ipAddrV6")),
-                "netmask": coalesce_none_or_empty(iface.get("netmask")),
-                "gateway": coalesce_none_or_empty(iface.get("gateway")),
-                "dns_servers": dns if type(dns) is list and len(dns) > 0 else []
-            }
-            network_interfaces.append(iface_info)
+        network_interfaces = _parse_network_settings(response)
 
         # If a specific interface was requested, pull it out of the list
         if interface is not None:
@@ -310,10 +347,14 @@ class System(object):
         else:
             return network_interfaces
 
+    @cached(ttl=30)
     def get_power_saving_mode(self):
         '''
         Returns the current power saving mode of the device.
 
+        Args:
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
+
         Raises:
             ApiError: The request to the target device failed.
 
@@ -328,25 +369,16 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        saving_mode = None
-        if "mode" in response:
-            valid_modes = {
-                "off": PowerSavingMode.OFF,
-                "low": PowerSavingMode.LOW,
-                "high": PowerSavingMode.HIGH,
-                "pictureOff": PowerSavingMode.PICTURE_OFF
-            }
-            saving_mode = valid_modes.get(response.get("mode"), PowerSavingMode.UNKNOWN)
-
-            if saving_mode == PowerSavingMode.UNKNOWN:
-                raise ApiError("API returned unexpected power saving mode '{0}'".format(response.get("mode")))
-
-        return saving_mode
+        return _parse_power_saving_mode(response)
 
+    @cached(ttl=3600)
     def get_remote_control_info(self):
         '''
         Returns a list of IRCC remote codes supported by the target device.
 
+        Args:
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
+
         Raises:
             ApiError: The request to the target device failed.
 
@@ -361,15 +393,7 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if len(response) != 2:
-            raise ApiError("API returned unexpected format for remote control information.")
-
-        button_codes = {}
-
-        for button in response[1]:
-            button_codes[button["name"]] = button["value"]
-
-        return button_codes
+        return _parse_remote_control_info(response)
 
     def get_remote_access_status(self):
         '''
@@ -394,22 +418,16 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if type(response) is not list or len(response) != 1:
-            raise ApiError("API returned unexpected getRemoteDeviceSettings response format")
-
-        if response[0].get("currentValue") == "on":
-            return True
-        elif response[0].get("currentValue") == "off":
-            return False
-        else:
-            raise ApiError(
-                "API returned unexpected getRemoteDeviceSettings response '{0}'".format(response)
-            )
+        return _parse_remote_access_status(response)
 
+    @cached(ttl=3600)
     def get_system_information(self):
         '''
         Returns information about the target device.
 
+        Args:
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
+
         Raises:
             ApiError: The request to the target device failed.
 
@@ -432,22 +450,16 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        sys_info = {
-            "product": coalesce_none_or_empty(response.get("product")),
-            "language": coalesce_none_or_empty(response.get("language")),
-            "model": coalesce_none_or_empty(response.get("model")),
-            "serial": coalesce_none_or_empty(response.get("serial")),
-            "mac": coalesce_none_or_empty(response.get("macAddr")),
-            "name": coalesce_none_or_empty(response.get("name")),
-            "generation": coalesce_none_or_empty(response.get("generation"))
-        }
-
-        return sys_info
+        return _parse_system_information(response)
 
+    @cached(ttl=3600)
     def get_wake_on_lan_mac(self):
         '''
         Returns the Wake-on-LAN (WOL) MAC address for the target device, if available.
 
+        Args:
+            use_cache (bool, optional): Defaults to True. Whether a recently cached result may be returned.
+
         Raises:
             ApiError: The request to the target device failed.
 
@@ -463,14 +475,7 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        if type(response) is not list:
-            raise ApiError("API returned unexpected getSystemSupportedFunction response format")
-
-        for entry in response:
-            if entry["option"] == "WOL":
-                return entry["value"]
-
-        return None
+        return _parse_wake_on_lan_mac(response)
 
     def get_wake_on_lan_status(self):
         '''
@@ -490,11 +495,37 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
-        enabled = response.get("enabled")
-        if enabled is None or type(enabled) is not bool:
-            raise ApiError("API returned unexpected getWolMode response format")
+        return _parse_wake_on_lan_status(response)
 
-        return enabled
+    def get_status_bundle(self):
+        '''
+        Returns the combined results of the system information methods, fetched with a single request to the target
+        device.
+
+        Raises:
+            ApiError: The request to the target device failed.
+
+        Returns:
+            dict: A dict containing the following keys, each holding the value returned by the corresponding method:
+
+            * interface_information: See :meth:`get_interface_information`.
+            * power_status: See :meth:`get_power_status`.
+            * led_status: See :meth:`get_led_status`.
+            * network_settings: See :meth:`get_network_settings`.
+            * power_saving_mode: See :meth:`get_power_saving_mode`.
+            * system_information: See :meth:`get_system_information`.
+            * wake_on_lan_mac: See :meth:`get_wake_on_lan_mac`.
+            * wake_on_lan_status: See :meth:`get_wake_on_lan_status`.
+        '''
+
+        self.bravia_client.initialize()
+
+        try:
+            responses = self.http_client.request_batch(_STATUS_BUNDLE_CALLS)
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_status_bundle(responses)
 
     def request_reboot(self):
         '''
@@ -526,26 +557,8 @@ class System(object):
         '''
         self.bravia_client.initialize()
 
-        if type(mode) is not LedMode:
-            raise TypeError("mode must be an LedMode enum value")
-
-        if mode == LedMode.UNKNOWN:
-            raise ValueError("mode cannot be LedMode.UNKNOWN")
-
-        modes = {
-            LedMode.AUTO_BRIGHTNESS: "AutoBrightnessAdjust",
-            LedMode.DARK: "Dark",
-            LedMode.SIMPLE_RESPONSE: "SimpleResponse",
-            LedMode.DEMO: "Demo",
-            LedMode.OFF: "Off"
-        }
-        sent_mode = modes.get(mode, LedMode.UNKNOWN)
-
-        if sent_mode == LedMode.UNKNOWN:
-            raise InternalError("Internal error: unsupported LedMode selected")
-
         params = {
-            "mode": sent_mode
+            "mode": _get_selected_led_mode(mode)
         }
 
         try:
@@ -553,6 +566,8 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
+        invalidate_cache(self, "get_led_status")
+
     def set_language(self, language):
         '''
         Sets the UI language of the target device. Language availabilit depends on the device's region settings.
@@ -569,7 +584,7 @@ class System(object):
 
         self.bravia_client.initialize()
 
-        if type(language) is not str:
+        if not isinstance(language, str):
             raise TypeError("language must be a string value")
 
         try:
@@ -585,6 +600,8 @@ class System(object):
             else:
                 raise ApiError(get_error_message(err.error_code, str(err))) from None
 
+        invalidate_cache(self, "get_system_information")
+
     def set_power_saving_mode(self, mode):
         '''
         Sets the specified power saving mode on the target device.
@@ -600,22 +617,7 @@ class System(object):
         '''
         self.bravia_client.initialize()
 
-        if type(mode) is not PowerSavingMode:
-            raise TypeError("mode must be a PowerSavingMode enum value")
-
-        if mode == PowerSavingMode.UNKNOWN:
-            raise ValueError("mode cannot be PowerSavingMode.UNKNOWN")
-
-        modes = {
-            PowerSavingMode.OFF: "off",
-            PowerSavingMode.LOW: "low",
-            PowerSavingMode.HIGH: "high",
-            PowerSavingMode.PICTURE_OFF: "pictureOff"
-        }
-        sent_mode = modes.get(mode, PowerSavingMode.UNKNOWN)
-
-        if sent_mode == PowerSavingMode.UNKNOWN:
-            raise InternalError("Internal error: unsupported PowerSavingMode selected")
+        sent_mode = _get_selected_power_saving_mode(mode)
 
         try:
             self.http_client.request(
@@ -627,6 +629,8 @@ class System(object):
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
 
+        invalidate_cache(self, "get_power_saving_mode")
+
     def set_wake_on_lan_status(self, enabled):
         '''
         Enables or disables Wake-on-LAN (WOL) on the target device.
@@ -641,7 +645,7 @@ class System(object):
 
         self.bravia_client.initialize()
 
-        if type(enabled) is not bool:
+        if not isinstance(enabled, bool):
             raise TypeError("enabled must be a boolean value")
 
         try:
@@ -653,3 +657,561 @@ class System(object):
             )
         except HttpError as err:
             raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+
+class AsyncSystem(object):
+    '''
+    Provides asynchronous functionality for configuring the target device. Each method behaves the same as its
+    counterpart in :class:`System`.
+
+    Args:
+        bravia_client: The parent :class:`AsyncBraviaClient` instance.
+        http_client: The :class:`AsyncHttp` instance associated with the parent client.
+    '''
+    __slots__ = ("bravia_client", "http_client", "_cache")
+
+    def __init__(self, bravia_client, http_client):
+        self.bravia_client = bravia_client
+        self.http_client = http_client
+
+    async def power_on(self):
+        '''
+        Wakes up the target device. See :meth:`System.power_on`.
+        '''
+
+        await self.set_power_status(True)
+
+    async def power_off(self):
+        '''
+        Puts the target device into standby. See :meth:`System.power_off`.
+        '''
+
+        await self.set_power_status(False)
+
+    async def set_power_status(self, power_state):
+        '''
+        Wakes or sleeps the target device. See :meth:`System.set_power_status`.
+        '''
+        await self.bravia_client.initialize()
+
+        if not isinstance(power_state, bool):
+            raise TypeError("power_state must be a boolean type")
+
+        try:
+            await self.http_client.request(
+                endpoint="system",
+                method="setPowerStatus",
+                params={"status": power_state},
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+    async def get_power_status(self):
+        '''
+        Returns the current power state of the target device. See :meth:`System.get_power_status`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(endpoint="system", method="getPowerStatus", version="1.0")
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_power_status(response)
+
+    async def get_current_time(self):
+        '''
+        Gets the current system time, if set. See :meth:`System.get_current_time`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(endpoint="system", method="getCurrentTime", version="1.1")
+            return _parse_current_time(response)
+
+        except HttpError as err:
+            # Illegal state indicates that the system clock is not set, so there is no time to return.
+            if (err.error_code == ErrorCode.ILLEGAL_STATE.value):
+                return None
+            else:
+                raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+    @cached(ttl=3600)
+    async def get_interface_information(self):
+        '''
+        Returns information about the server on the target device. See :meth:`System.get_interface_information`.
+        '''
+
+        # Do not initialize the client in this method, as it is used to determine API version during initialization.
+
+        try:
+            response = await self.http_client.request(
+                endpoint="system",
+                method="getInterfaceInformation",
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_interface_information(response)
+
+    @cached(ttl=30)
+    async def get_led_status(self):
+        '''
+        Returns the current mode of the device's LED and whether it is enabled. See :meth:`System.get_led_status`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(
+                endpoint="system",
+                method="getLEDIndicatorStatus",
+                version="1.0"
+            )
+        except HttpError as err:
+            if err.error_code == ErrorCode.ILLEGAL_STATE.value:
+                return None
+            else:
+                raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_led_status(response)
+
+    @cached(ttl=30)
+    async def get_network_settings(self, interface=None):
+        '''
+        Returns informaton about the target device's network configuration. See :meth:`System.get_network_settings`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        request_interface = interface or ""
+
+        if not isinstance(request_interface, str):
+            raise TypeError("interface argument must be a string")
+
+        try:
+            response = await self.http_client.request(
+                endpoint="system",
+                method="getNetworkSettings",
+                version="1.0",
+                params={"netif": request_interface}
+            )
+        except HttpError as err:
+            # An illegal argument error indicates the requested interface does not exist. Gracefully handle this.
+            if err.error_code == ErrorCode.ILLEGAL_ARGUMENT.value:
+                return None
+            else:
+                raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        network_interfaces = _parse_network_settings(response)
+
+        # If a specific interface was requested, pull it out of the list
+        if interface is not None:
+            return network_interfaces[0]
+        else:
+            return network_interfaces
+
+    @cached(ttl=30)
+    async def get_power_saving_mode(self):
+        '''
+        Returns the current power saving mode of the device. See :meth:`System.get_power_saving_mode`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(endpoint="system", method="getPowerSavingMode", version="1.0")
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_power_saving_mode(response)
+
+    @cached(ttl=3600)
+    async def get_remote_control_info(self):
+        '''
+        Returns a list of IRCC remote codes supported by the target device. See :meth:`System.get_remote_control_info`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(
+                endpoint="system",
+                method="getRemoteControllerInfo",
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_remote_control_info(response)
+
+    async def get_remote_access_status(self):
+        '''
+        Returns whether remote access is enabled on the target device. See :meth:`System.get_remote_access_status`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(
+                endpoint="system",
+                method="getRemoteDeviceSettings",
+                params={"target": "accessPermission"},
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_remote_access_status(response)
+
+    @cached(ttl=3600)
+    async def get_system_information(self):
+        '''
+        Returns information about the target device. See :meth:`System.get_system_information`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(endpoint="system", method="getSystemInformation", version="1.0")
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_system_information(response)
+
+    @cached(ttl=3600)
+    async def get_wake_on_lan_mac(self):
+        '''
+        Returns the Wake-on-LAN (WOL) MAC address for the target device, if available. See\
+        :meth:`System.get_wake_on_lan_mac`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(
+                endpoint="system",
+                method="getSystemSupportedFunction",
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_wake_on_lan_mac(response)
+
+    async def get_wake_on_lan_status(self):
+        '''
+        Returns whether the Wake-on-LAN (WOL) function of the target device is enabled. See\
+        :meth:`System.get_wake_on_lan_status`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            response = await self.http_client.request(endpoint="system", method="getWolMode", version="1.0")
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_wake_on_lan_status(response)
+
+    async def get_status_bundle(self):
+        '''
+        Returns the combined results of the system information methods, fetched with a single request to the target
+        device. See :meth:`System.get_status_bundle`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            responses = await self.http_client.request_batch(_STATUS_BUNDLE_CALLS)
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        return _parse_status_bundle(responses)
+
+    async def request_reboot(self):
+        '''
+        Reboots the target device. See :meth:`System.request_reboot`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        try:
+            await self.http_client.request(endpoint="system", method="requestReboot", version="1.0")
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+    async def set_led_status(self, mode):
+        '''
+        Sets the LED mode of the target device. See :meth:`System.set_led_status`.
+        '''
+        await self.bravia_client.initialize()
+
+        params = {
+            "mode": _get_selected_led_mode(mode)
+        }
+
+        try:
+            await self.http_client.request(
+                endpoint="system",
+                method="setLEDIndicatorStatus",
+                params=params,
+                version="1.1"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        invalidate_cache(self, "get_led_status")
+
+    async def set_language(self, language):
+        '''
+        Sets the UI language of the target device. See :meth:`System.set_language`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        if not isinstance(language, str):
+            raise TypeError("language must be a string value")
+
+        try:
+            await self.http_client.request(
+                endpoint="system",
+                method="setLanguage",
+                params={"language": language},
+                version="1.0"
+            )
+        except HttpError as err:
+            if err.error_code == ErrorCode.ILLEGAL_ARGUMENT.value:
+                raise LanguageNotSupportedError()
+            else:
+                raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        invalidate_cache(self, "get_system_information")
+
+    async def set_power_saving_mode(self, mode):
+        '''
+        Sets the specified power saving mode on the target device. See :meth:`System.set_power_saving_mode`.
+        '''
+        await self.bravia_client.initialize()
+
+        sent_mode = _get_selected_power_saving_mode(mode)
+
+        try:
+            await self.http_client.request(
+                endpoint="system",
+                method="setPowerSavingMode",
+                params={"mode": sent_mode},
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+        invalidate_cache(self, "get_power_saving_mode")
+
+    async def set_wake_on_lan_status(self, enabled):
+        '''
+        Enables or disables Wake-on-LAN (WOL) on the target device. See :meth:`System.set_wake_on_lan_status`.
+        '''
+
+        await self.bravia_client.initialize()
+
+        if not isinstance(enabled, bool):
+            raise TypeError("enabled must be a boolean value")
+
+        try:
+            await self.http_client.request(
+                endpoint="system",
+                method="setWolMode",
+                params={"enabled": enabled},
+                version="1.0"
+            )
+        except HttpError as err:
+            raise ApiError(get_error_message(err.error_code, str(err))) from None
+
+
+def _parse_power_status(response):
+    if response["status"] == "standby":
+        return False
+
+    if response["status"] == "active":
+        return True
+
+    raise ApiError(f"Unexpected getPowerStatus response '{response['status']}'")
+
+
+def _parse_interface_information(response):
+    return {dst: response.get(src) or None for dst, src in _INTERFACE_FIELDS}
+
+
+def _parse_led_status(response):
+    # API may return None for LED status if it is unknown
+    led_status = _LED_STATUSES.get(response.get("status"))
+
+    # A missing mode is reported as None, but one that is present must be recognized
+    mode = response.get("mode")
+    led_mode = _LED_MODES_IN.get(mode)
+    if led_mode is None and "mode" in response:
+        raise ApiError(f"API returned unexpected LED mode '{mode}'")
+
+    return {
+        "status": led_status,
+        "mode": led_mode
+    }
+
+
+def _parse_network_settings(response):
+    if not isinstance(response, list):
+        raise ApiError("API returned unexpected response format for getNetworkSettings")
+
+    network_interfaces = []
+    for iface in response:
+        dns = iface.get("dns")
+
+        iface_info = {dst: iface.get(src) or None for dst, src in _NETWORK_INTERFACE_FIELDS}
+        iface_info["dns_servers"] = dns if isinstance(dns, list) and len(dns) > 0 else []
+        network_interfaces.append(iface_info)
+
+    return network_interfaces
+
+
+def _parse_power_saving_mode(response):
+    # A missing mode is reported as None, but one that is present must be recognized
+    mode = response.get("mode")
+    saving_mode = _SAVING_MODES_IN.get(mode)
+    if saving_mode is None and "mode" in response:
+        raise ApiError(f"API returned unexpected power saving mode '{mode}'")
+
+    return saving_mode
+
+
+def _parse_system_information(response):
+    return {dst: response.get(src) or None for dst, src in _SYSTEM_INFO_FIELDS}
+
+
+def _parse_wake_on_lan_mac(response):
+    if not isinstance(response, list):
+        raise ApiError("API returned unexpected getSystemSupportedFunction response format")
+
+    for entry in response:
+        if entry["option"] == "WOL":
+            return entry["value"]
+
+    return None
+
+
+def _parse_wake_on_lan_status(response):
+    enabled = response.get("enabled")
+    if not isinstance(enabled, bool):
+        raise ApiError("API returned unexpected getWolMode response format")
+
+    return enabled
+
+
+def _check_batch_response(response):
+    if isinstance(response, HttpError):
+        raise ApiError(get_error_message(response.error_code, str(response))) from None
+
+    return response
+
+
+def _parse_status_bundle(responses):
+    (
+        interface_info,
+        power_status,
+        led_status,
+        network_settings,
+        power_saving_mode,
+        system_info,
+        supported_functions,
+        wol_mode
+    ) = responses
+
+    # As in get_led_status(), an illegal state indicates that the LED mode cannot be determined
+    if isinstance(led_status, HttpError) and led_status.error_code == ErrorCode.ILLEGAL_STATE.value:
+        parsed_led_status = None
+    else:
+        parsed_led_status = _parse_led_status(_check_batch_response(led_status))
+
+    return {
+        "interface_information": _parse_interface_information(_check_batch_response(interface_info)),
+        "power_status": _parse_power_status(_check_batch_response(power_status)),
+        "led_status": parsed_led_status,
+        "network_settings": _parse_network_settings(_check_batch_response(network_settings)),
+        "power_saving_mode": _parse_power_saving_mode(_check_batch_response(power_saving_mode)),
+        "system_information": _parse_system_information(_check_batch_response(system_info)),
+        "wake_on_lan_mac": _parse_wake_on_lan_mac(_check_batch_response(supported_functions)),
+        "wake_on_lan_status": _parse_wake_on_lan_status(_check_batch_response(wol_mode))
+    }
+
+
+def _parse_current_time(response):
+    # The API returns ISO 8601 timestamps with offsets such as "+0900" or "Z", which fromisoformat() only accepts
+    # from Python 3.11 onwards, so convert the offset to the "+09:00" form first.
+    timestamp = _UTC_OFFSET_RE.sub(_format_utc_offset, response["dateTime"])
+
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        raise ApiError(f"API returned unexpected time '{response['dateTime']}'") from None
+
+
+def _format_utc_offset(match):
+    if match.group(0) == "Z":
+        return "+00:00"
+
+    return f"{match.group(1)}:{match.group(2)}"
+
+
+def _parse_remote_control_info(response):
+    if len(response) != 2:
+        raise ApiError("API returned unexpected format for remote control information.")
+
+    return dict(map(_get_name_and_value, response[1]))
+
+
+def _parse_remote_access_status(response):
+    if not isinstance(response, list) or len(response) != 1:
+        raise ApiError("API returned unexpected getRemoteDeviceSettings response format")
+
+    if response[0].get("currentValue") == "on":
+        return True
+    elif response[0].get("currentValue") == "off":
+        return False
+    else:
+        raise ApiError(
+            f"API returned unexpected getRemoteDeviceSettings response '{response}'"
+        )
+
+
+def _get_selected_led_mode(mode):
+    if not isinstance(mode, LedMode):
+        raise TypeError("mode must be an LedMode enum value")
+
+    if mode == LedMode.UNKNOWN:
+        raise ValueError("mode cannot be LedMode.UNKNOWN")
+
+    sent_mode = _LED_MODES_OUT.get(mode, LedMode.UNKNOWN)
+
+    if sent_mode == LedMode.UNKNOWN:
+        raise InternalError("Internal error: unsupported LedMode selected")
+
+    return sent_mode
+
+
+def _get_selected_power_saving_mode(mode):
+    if not isinstance(mode, PowerSavingMode):
+        raise TypeError("mode must be a PowerSavingMode enum value")
+
+    if mode == PowerSavingMode.UNKNOWN:
+        raise ValueError("mode cannot be PowerSavingMode.UNKNOWN")
+
+    sent_mode = _SAVING_MODES_OUT.get(mode, PowerSavingMode.UNKNOWN)
+
+    if sent_mode == PowerSavingMode.UNKNOWN:
+        raise InternalError("Internal error: unsupported PowerSavingMode selected")
+
+    return sent_mode
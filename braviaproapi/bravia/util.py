@@ -1,3 +1,9 @@
+from copy import deepcopy
+from functools import wraps
+from inspect import iscoroutinefunction, signature
+from time import monotonic
+
+
 def coalesce_none_or_empty(input_string):
     '''
     Returns the input string or None if it is empty.
@@ -13,3 +19,90 @@ def coalesce_none_or_empty(input_string):
         return None
     else:
         return input_string
+
+
+def cached(ttl):
+    '''
+    Decorates a method so that its results are cached on the instance for a period of time. Both regular and
+    coroutine methods are supported.
+
+    Results are cached separately for each combination of arguments, whether they are passed positionally or by
+    keyword. Calls with arguments that cannot be hashed are passed through without caching. The decorated method
+    accepts an additional `use_cache` keyword argument; passing `use_cache=False` ignores any cached result and
+    refreshes it.
+
+    Args:
+        ttl (int or float): The number of seconds for which a result remains valid.
+
+    Returns:
+        callable: The method decorator.
+    '''
+
+    def decorator(func):
+        func_signature = signature(func)
+
+        def lookup(self, args, kwargs):
+            try:
+                cache = self._cache
+            except AttributeError:
+                cache = self._cache = {}
+
+            # Leave invalid or unhashable arguments for the method itself to reject
+            try:
+                bound = func_signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                key = (func.__name__, tuple(bound.arguments.items())[1:])
+                return cache, key, cache.get(key)
+            except TypeError:
+                return cache, None, None
+
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, use_cache=True, **kwargs):
+                cache, key, entry = lookup(self, args, kwargs)
+                if key is None:
+                    return await func(self, *args, **kwargs)
+                if use_cache and entry is not None and monotonic() - entry[0] < ttl:
+                    return deepcopy(entry[1])
+
+                result = await func(self, *args, **kwargs)
+                cache[key] = (monotonic(), result)
+
+                return deepcopy(result)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, use_cache=True, **kwargs):
+            cache, key, entry = lookup(self, args, kwargs)
+            if key is None:
+                return func(self, *args, **kwargs)
+            if use_cache and entry is not None and monotonic() - entry[0] < ttl:
+                return deepcopy(entry[1])
+
+            result = func(self, *args, **kwargs)
+            cache[key] = (monotonic(), result)
+
+            # Callers may modify the result, so never hand out the cached instance
+            return deepcopy(result)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cache(instance, *method_names):
+    '''
+    Discards results cached by :func:`cached` for the given methods of an instance.
+
+    Args:
+        instance: The object whose cached results should be discarded.
+        *method_names (str): The names of the methods whose results should be discarded.
+    '''
+
+    cache = getattr(instance, "_cache", None)
+    if not cache:
+        return
+
+    for key in [key for key in cache if key[0] in method_names]:
+        del cache[key]
@@ -1,6 +1,42 @@
-from .bravia import Http, System, VideoScreen, Encryption, AppControl, Audio, Remote, AvContent
+from functools import lru_cache
+from importlib import import_module
 from .bravia.errors import ApiError, HttpError
-from packaging import version
+from .bravia.http import Http
+
+
+class _Subsystem(object):
+    '''
+    Creates an API subsystem for a client the first time it is accessed, so that subsystems which are never used are
+    neither imported nor instantiated.
+
+    Args:
+        module (str): The module, relative to this package, containing the subsystem class.
+        class_name (str): The name of the subsystem class.
+    '''
+
+    def __init__(self, module, class_name):
+        self.module = module
+        self.class_name = class_name
+        self.slot_name = None
+
+    def __set_name__(self, owner, name):
+        # The subsystem is stored in a slot named after the attribute, prefixed with an underscore
+        self.slot_name = "_" + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            pass
+
+        subsystem_class = getattr(import_module(self.module, __package__), self.class_name)
+        subsystem = subsystem_class(bravia_client=instance, http_client=instance.http_client)
+        setattr(instance, self.slot_name, subsystem)
+
+        return subsystem
 
 
 class BraviaClient(object):
@@ -13,6 +49,7 @@ class BraviaClient(object):
         avcontent (AvContent): Provides control for content displayed by the device.
         encryption (Encryption): Provides access to device encryption.
         http_client (Http): HTTP client for direct API communication with the device.
+        initialized (bool): Whether the client has verified compatibility with the target device.
         remote (Remote): Provides remote control input and information relating to it.
         system (System): Provides system information and configuration functionality.
         videoscreen (VideoScreen): Provides control of the device's display.
@@ -21,17 +58,20 @@ class BraviaClient(object):
         host (str): The IP address or domain name belonging to the target device.
         passcode (str): The pre-shared key configured on the target device.
     '''
-    __initialized = False
+    __slots__ = ("http_client", "initialized", "_encryption", "_system", "_videoscreen", "_appcontrol", "_audio",
+                 "_remote", "_avcontent")
+
+    encryption = _Subsystem(".bravia.encryption", "Encryption")
+    system = _Subsystem(".bravia.system", "System")
+    videoscreen = _Subsystem(".bravia.videoscreen", "VideoScreen")
+    appcontrol = _Subsystem(".bravia.appcontrol", "AppControl")
+    audio = _Subsystem(".bravia.audio", "Audio")
+    remote = _Subsystem(".bravia.remote", "Remote")
+    avcontent = _Subsystem(".bravia.avcontent", "AvContent")
 
     def __init__(self, host, passcode):
         self.http_client = Http(host=host, psk=passcode)
-        self.encryption = Encryption(bravia_client=self, http_client=self.http_client)
-        self.system = System(bravia_client=self, http_client=self.http_client)
-        self.videoscreen = VideoScreen(bravia_client=self, http_client=self.http_client)
-        self.appcontrol = AppControl(bravia_client=self, http_client=self.http_client)
-        self.audio = Audio(bravia_client=self, http_client=self.http_client)
-        self.remote = Remote(bravia_client=self, http_client=self.http_client)
-        self.avcontent = AvContent(bravia_client=self, http_client=self.http_client)
+        self.initialized = False
 
     def initialize(self):
         '''
@@ -40,7 +80,7 @@ class BraviaClient(object):
         Raises:
             ApiError: The request to the target device failed.
         '''
-        if self.__initialized:
+        if self.initialized:
             return
 
         # Verify that the API version is compatible
@@ -51,18 +91,122 @@ class BraviaClient(object):
                 "Unable to verify API version compatibility due to an API error: {0}".format(str(err))
             ) from None
 
-        api_version = interface_info["interface_version"]
-        if api_version is None:
-            raise ApiError(
-                "Unable to verify API version compatibility because the device did not indicate its API version."
-            ) from None
+        _check_api_version(interface_info)
 
-        if (
-            version.parse(api_version) >= version.parse("4.0.0")
-            or version.parse(api_version) < version.parse("3.0.0")
-        ):
-            raise ApiError(
-                "The target device is running an incompatible API version '{0}'".format(api_version)
-            ) from None
+        self.initialized = True
+
+    def close(self):
+        '''
+        Closes any open connections to the target device.
+        '''
+
+        self.http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncBraviaClient(object):
+    '''
+    Provides an asynchronous client for interacting with the Bravia API. Requires the `httpx` package.
+
+    Only audio and system functionality is currently available asynchronously. The client should be used as an
+    asynchronous context manager, or closed with :meth:`close` when no longer needed.
+
+    Attributes:
+        audio (AsyncAudio): Provides audio control and information.
+        http_client (AsyncHttp): HTTP client for direct API communication with the device.
+        initialized (bool): Whether the client has verified compatibility with the target device.
+        system (AsyncSystem): Provides system information and configuration functionality.
+
+    Args:
+        host (str): The IP address or domain name belonging to the target device.
+        passcode (str): The pre-shared key configured on the target device.
+
+    Raises:
+        ImportError: The `httpx` package is not installed.
+    '''
+    __slots__ = ("http_client", "initialized", "__initialize_lock", "_system", "_audio")
+
+    system = _Subsystem(".bravia.system", "AsyncSystem")
+    audio = _Subsystem(".bravia.audio", "AsyncAudio")
+
+    def __init__(self, host, passcode):
+        from .bravia.http_async import AsyncHttp
+
+        self.http_client = AsyncHttp(host=host, psk=passcode)
+        self.initialized = False
+        self.__initialize_lock = None
+
+    async def initialize(self):
+        '''
+        Initializes the API client by verifying connectivity and compatibility with the target device.
+
+        Raises:
+            ApiError: The request to the target device failed.
+        '''
+        if self.initialized:
+            return
+
+        # Concurrent calls made before initialization completes should only verify the API version once
+        if self.__initialize_lock is None:
+            from asyncio import Lock
+
+            self.__initialize_lock = Lock()
+
+        async with self.__initialize_lock:
+            if self.initialized:
+                return
+
+            # Verify that the API version is compatible
+            try:
+                interface_info = await self.system.get_interface_information()
+            except HttpError as err:
+                raise ApiError(
+                    "Unable to verify API version compatibility due to an API error: {0}".format(str(err))
+                ) from None
+
+            _check_api_version(interface_info)
+
+            self.initialized = True
+
+    async def close(self):
+        '''
+        Closes any open connections to the target device.
+        '''
+
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+def _check_api_version(interface_info):
+    # packaging is only needed once per client, so avoid loading it until then
+    from packaging import version
+
+    api_version = interface_info["interface_version"]
+    if api_version is None:
+        raise ApiError(
+            "Unable to verify API version compatibility because the device did not indicate its API version."
+        ) from None
+
+    min_api, max_api_exclusive = _get_supported_api_versions()
+    parsed_version = version.parse(api_version)
+    if parsed_version >= max_api_exclusive or parsed_version < min_api:
+        raise ApiError(
+            "The target device is running an incompatible API version '{0}'".format(api_version)
+        ) from None
+
+
+@lru_cache(maxsize=None)
+def _get_supported_api_versions():
+    from packaging import version
 
-        self.__initialized = True
+    return version.parse("3.0.0"), version.parse("4.0.0")
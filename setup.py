@@ -24,9 +24,12 @@ setuptools.setup(
     setup_requires=["setuptools_scm"],
     install_requires=[
         "requests>=2,<3",
-        "python-dateutil>=2,<3",
         "pycryptodome>=3,<4",
         "packaging"
     ],
+    extras_require={
+        "orjson": ["orjson>=3,<4"],
+        "async": ["httpx>=0.18,<1"]
+    },
     keywords='sony bravia television remote control library'
 )